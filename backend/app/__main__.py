@@ -1,6 +1,11 @@
 import asyncio
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows
+    uvloop = None
+
 from app import settings
 from app.handlers.jstv import load_jstv_plugins
 from app.handlers.jstv.commands import db as dbcmdhandlers
@@ -8,6 +13,25 @@ from app.log import setup_logging
 from app.db.database import async_setup_database
 
 
+# ==============================================================================
+# Event Loop
+
+def get_event_loop_name() -> str:
+    """Return the event loop implementation to use, based on settings.EVENT_LOOP."""
+    name = settings.EVENT_LOOP
+
+    if name == "auto":
+        return "uvloop" if uvloop is not None else "asyncio"
+
+    if name == "uvloop" and uvloop is None:
+        raise RuntimeError("EVENT_LOOP is set to uvloop, but uvloop is not installed")
+
+    if name not in ("uvloop", "asyncio"):
+        raise RuntimeError(f"Unknown EVENT_LOOP: {name}")
+
+    return name
+
+
 # ==============================================================================
 # Main
 
@@ -33,7 +57,10 @@ async def async_main():
     await server.serve()
 
 def main():
-    asyncio.run(async_main())
+    loop_factory = None
+    if get_event_loop_name() == "uvloop":
+        loop_factory = uvloop.new_event_loop
+    asyncio.run(async_main(), loop_factory=loop_factory)
 
 if __name__ == "__main__":
     try:
@@ -1,15 +1,27 @@
 from typing import ClassVar
+import importlib
 import asyncio
 
-from app import log
-from app.connector import ConnectorManager
-from app.connectors.joysticktv import JoystickTVConnector
-from app.connectors.warudo import WarudoConnector
-from app.connectors.streamerbot import StreamerBotConnector
-from app.connectors.obs import OBSConnector
-from app.connectors.buttplug import ButtplugConnector, ButtplugProxyConnector, ButtplugReceiverConnector
-from app.connectors.pishock import PiShockConnector
-from app.connectors.vrchat import VRChatConnector
+from app import log, settings
+from app.connector import ConnectorManager, BaseConnector
+
+
+# ==============================================================================
+# Config
+
+# Module defining each connector, keyed by casefolded connector NAME.
+# Modules are only imported when their connector is enabled.
+CONNECTOR_MODULES: dict[str, str] = {
+    "joysticktv": "app.connectors.joysticktv",
+    "warudo": "app.connectors.warudo",
+    "streamerbot": "app.connectors.streamerbot",
+    "obs": "app.connectors.obs",
+    "buttplug": "app.connectors.buttplug",
+    "buttplugproxy": "app.connectors.buttplug",
+    "buttplugreceiver": "app.connectors.buttplug",
+    "pishock": "app.connectors.pishock",
+    "vrchat": "app.connectors.vrchat",
+}
 
 
 # ==============================================================================
@@ -29,16 +41,24 @@ class Bot(ConnectorManager):
 
         self._initialized = True
 
-        # Create and register connectors
-        JoystickTVConnector(self)
-        WarudoConnector(self)
-        # StreamerBotConnector(self)
-        OBSConnector(self)
-        ButtplugConnector(self)
-        # ButtplugProxyConnector(self)
-        # ButtplugReceiverConnector(self)
-        PiShockConnector(self)
-        VRChatConnector(self)
+        # Create and register enabled connectors
+        for name in settings.ENABLED_CONNECTORS:
+            name_fold = name.casefold()
+
+            module = CONNECTOR_MODULES.get(name_fold)
+            if module is None:
+                self.logger.warning("Unknown connector: %s", name)
+                continue
+
+            importlib.import_module(module)
+            BaseConnector.connectors[name_fold](self)
+
+        # Run any I/O-bound connector setup concurrently
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            asyncio.eager_task_factory(loop, conn.setup())
+            for conn in self._connectors.values()
+        ))
 
     async def run(self):
         await self.init()
@@ -49,12 +69,3 @@ class Bot(ConnectorManager):
         self.INSTANCES.discard(self)
         return await super().shutdown()
 
-
-# ==============================================================================
-# __main__
-
-if __name__ == "__main__":
-    try:
-        asyncio.run(Bot().run())
-    except asyncio.CancelledError:
-        pass
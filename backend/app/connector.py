@@ -1,15 +1,17 @@
-from typing import NamedTuple, TypeVar, ClassVar, Optional, Any, overload
+from typing import TypeVar, ClassVar, Optional, Any, Iterable, overload
+from types import MappingProxyType
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from collections import deque
 import abc
 import itertools
 import asyncio
 import logging
-import json
 import websockets
 import socket
 
 from .settings import MAX_INIT_ATTEMPTS, MAX_RECONNECT_DELAY
-from .utils.asyncio import async_select
+from .utils import json
 
 
 # ==============================================================================
@@ -17,6 +19,15 @@ from .utils.asyncio import async_select
 
 MANAGER_NAME = "Manager"
 
+# Upper bound for queued connector messages; further messages are dropped and logged
+MSG_QUEUE_MAXSIZE = 8192
+
+# Maximum number of queued WebSocket messages written per sender wake-up
+SEND_BATCH_SIZE = 128
+
+# Incoming WebSocket frames buffered by the connection while main_loop is busy
+RECV_QUEUE_SIZE = 64
+
 
 # ==============================================================================
 # Constants
@@ -26,6 +37,10 @@ ConnectorT = TypeVar("ConnectorT", bound="BaseConnector")
 
 MISSING = object()
 
+# An outgoing WebSocket frame as (data, text, sent); `sent` resolves to
+# whether the frame was written to the connection
+OutMessage = tuple[str | bytes, bool | None, asyncio.Future[bool]]
+
 
 # ==============================================================================
 # Exceptions
@@ -38,7 +53,8 @@ class ConnectorReconnect(ConnectorControlEvent): pass
 # ==============================================================================
 # ConnectorMessage
 
-class ConnectorMessage(NamedTuple):
+@dataclass(slots=True)
+class ConnectorMessage:
     """
     A message to be sent to a connector.
     WARNING: Auto-incremented message IDs are not thread-safe.
@@ -58,7 +74,7 @@ class ConnectorMessage(NamedTuple):
     @classmethod
     def make(cls, sender: str, receiver: str, action: str, data: Any):
         """Create a new message with a unique ID."""
-        return cls(cls.next_message_id(), sender, receiver, action, data)
+        return cls(next(cls.__message_id), sender, receiver, action, data)
 
     @classmethod
     def next_message_id(cls) -> int:
@@ -71,11 +87,14 @@ class ConnectorMessage(NamedTuple):
 
 class ConnectorManager:
     """Manage connectors and dispatch messages to and between them."""
+    __slots__ = ("name", "logger", "_connectors", "_shutdown", "_wake", "_msg_queue", "__weakref__")
+
     name: str
     logger: logging.Logger
 
     _connectors: dict[str, "BaseConnector"]
     _shutdown: asyncio.Event
+    _wake: asyncio.Event  # Set when messages are queued or on shutdown
 
     # A queue of messages to be sent to a connector, usually from another connector.
     # Each message is a tuple of (receiver, action, data).
@@ -87,7 +106,8 @@ class ConnectorManager:
 
         self._connectors = {}
         self._shutdown = asyncio.Event()
-        self._msg_queue = asyncio.Queue()
+        self._wake = asyncio.Event()
+        self._msg_queue = asyncio.Queue(MSG_QUEUE_MAXSIZE)
 
     @overload
     def get(self, name_or_type: str, default: T = None) -> "BaseConnector" | T: ...
@@ -147,13 +167,18 @@ class ConnectorManager:
 
     async def run(self):
         """Start the manager and all registered connectors."""
-        tasks = [conn.connect_loop() for conn in self._connectors.values()]
-        tasks.append(self.talk_loop())
+        # Start eagerly so each connector runs up to its first real suspension
+        # point right away, instead of waiting for a scheduler round-trip.
+        loop = asyncio.get_running_loop()
+        coros = [conn.connect_loop() for conn in self._connectors.values()]
+        coros.append(self.talk_loop())
+        tasks = [asyncio.eager_task_factory(loop, coro) for coro in coros]
         await asyncio.gather(*tasks)
 
     async def shutdown(self):
         """Shutdown the manager and all registered connectors."""
         self._shutdown.set()
+        self._wake.set()
         tasks = (conn.shutdown() for conn in self._connectors.values())
         await asyncio.gather(*tasks)
 
@@ -161,43 +186,91 @@ class ConnectorManager:
         """Continuously dispatch messages from the queue."""
         self._shutdown.clear()
 
-        while True:
-            try:
-                stask = asyncio.create_task(self._shutdown.wait())
-                qtask = asyncio.create_task(self._msg_queue.get())
-
-                done = await async_select(stask, qtask)
-                if stask in done:
-                    break
-
-                msg = qtask.result()
-                conn = self._connectors.get(msg.receiver)
+        try:
+            while not self._shutdown.is_set():
+                # Woken by talkto() or shutdown(); no tasks are created per message
+                await self._wake.wait()
+                self._wake.clear()
+
+                while not self._shutdown.is_set():
+                    # Drain everything queued so far and deliver it as one batch
+                    batch: dict[str, list[ConnectorMessage]] = {}
+                    count = 0
+                    while True:
+                        try:
+                            msg = self._msg_queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
+                        batch.setdefault(msg.receiver, []).append(msg)
+                        count += 1
+
+                    if not count:
+                        break
 
-                if conn is None:
-                    self.logger.warning("Connector not found; message: %r, data: %s", msg, msg.data)
+                    try:
+                        if len(batch) == 1:
+                            await self._dispatch_many(*batch.values())
+                        else:
+                            await asyncio.gather(*map(self._dispatch_many, batch.values()))
+                    finally:
+                        for _ in range(count):
+                            self._msg_queue.task_done()
+
+        except asyncio.CancelledError:
+            self.logger.info("Received CancelledError, shutting down connector manager...")
+            self._shutdown.set()
+            raise
+
+    async def _dispatch_many(self, msgs: list[ConnectorMessage]):
+        """
+        Deliver messages in order; used per receiver so that different
+        connectors are served concurrently while each keeps its ordering.
+        """
+        for msg in msgs:
+            await self._dispatch(msg)
 
-                elif not conn._connected:
-                    self.logger.warning("Connector not connected; message: %r, data: %s", msg, msg.data)
+    async def _dispatch(self, msg: ConnectorMessage):
+        """Deliver a single message to its receiving connector."""
+        conn = self._connectors.get(msg.receiver)
 
-                else:
-                    try:
-                        # self.logger.debug(f"Delivering connector message: %r, data: %s", msg, msg.data)
-                        await conn.talk_receive(msg)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        self.logger.exception("Exception processing connector message: %r, data: %s", msg, msg.data)
+        if conn is None:
+            self.logger.warning("Connector not found; message: %r, data: %s", msg, msg.data)
 
-                self._msg_queue.task_done()
+        elif not conn._connected:
+            self.logger.warning("Connector not connected; message: %r, data: %s", msg, msg.data)
 
+        else:
+            try:
+                # self.logger.debug(f"Delivering connector message: %r, data: %s", msg, msg.data)
+                await conn.talk_receive(msg)
             except asyncio.CancelledError:
-                self.logger.info("Received CancelledError, shutting down connector manager...")
-                self._shutdown.set()
                 raise
+            except Exception as e:
+                self.logger.exception("Exception processing connector message: %r, data: %s", msg, msg.data)
 
     async def talkto(self, sender: str, receiver: str, action: str, data: Any):
-        """Queue a message to a specific connector."""
-        await self._msg_queue.put(ConnectorMessage.make(sender, receiver, action, data))
+        """
+        Queue a message to a specific connector.
+        Never waits for queue space, as connectors call this from within
+        message dispatch; the message is dropped if the queue is full.
+        """
+        self.talkto_nowait(sender, receiver, action, data)
+
+    def talkto_nowait(self, sender: str, receiver: str, action: str, data: Any) -> bool:
+        """
+        Queue a message to a specific connector without waiting.
+        The message is dropped if the queue is full; returns whether it was queued.
+        """
+        msg = ConnectorMessage.make(sender, receiver, action, data)
+
+        try:
+            self._msg_queue.put_nowait(msg)
+        except asyncio.QueueFull:
+            self.logger.warning("Message queue full, dropping message: %r", msg)
+            return False
+
+        self._wake.set()
+        return True
 
 
 # ==============================================================================
@@ -206,6 +279,9 @@ class ConnectorManager:
 class BaseConnector(abc.ABC):
     NAME: ClassVar[str]
 
+    _subclasses: ClassVar[dict[str, type["BaseConnector"]]] = {}
+    connectors: ClassVar[MappingProxyType[str, type["BaseConnector"]]] = MappingProxyType(_subclasses)
+
     manager: "ConnectorManager"
     logger: logging.Logger
 
@@ -219,6 +295,24 @@ class BaseConnector(abc.ABC):
 
         manager.register(self)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Only register connectors that define their own NAME
+        name: str | None = cls.__dict__.get("NAME")
+        if not name:
+            return
+
+        name_fold = name.casefold()
+        subclasses = BaseConnector._subclasses
+
+        # Ensure name is unique
+        other = subclasses.get(name_fold)
+        if other is not None:
+            raise TypeError(f"Same NAME in {cls.__name__} and {other.__name__}: {name}")
+
+        subclasses[name_fold] = cls
+
     def __bool__(self):
         return self.is_connected
 
@@ -226,6 +320,13 @@ class BaseConnector(abc.ABC):
     def is_connected(self) -> bool:
         return self._connected
 
+    async def setup(self):
+        """
+        Perform I/O-bound initialization before the first connection attempt.
+        Called concurrently for all connectors; keep __init__ cheap instead.
+        """
+        pass
+
     async def shutdown(self):
         """Shutdown the connector."""
         self._shutdown.set()
@@ -250,7 +351,15 @@ class BaseConnector(abc.ABC):
                     2 ** (reconnect_attempt - 1),
                 )
                 self.logger.info("Reconnecting in %d seconds...", delay)
-                await asyncio.sleep(delay)
+
+                # Wait out the delay, but stop waiting as soon as we are shut down
+                try:
+                    async with asyncio.timeout(delay):
+                        await self._shutdown.wait()
+                except TimeoutError:
+                    pass
+                else:
+                    break
 
             if initializing:
                 self.logger.info(f"Connecting [attempt {reconnect_attempt} of {MAX_INIT_ATTEMPTS}]...")
@@ -335,13 +444,33 @@ class BaseConnector(abc.ABC):
         """Queue a message to a specific connector."""
         await self.manager.talkto(self.NAME, receiver, action, data)
 
+    def talkto_nowait(self, receiver: str, action: str, data: Any) -> bool:
+        """Queue a message to a specific connector, dropping it if the queue is full."""
+        return self.manager.talkto_nowait(self.NAME, receiver, action, data)
+
 
 # ==============================================================================
 # WebSocket Connector
 
 class WebSocketConnector(BaseConnector):
+    SKIP_UTF8_VALIDATION: ClassVar[bool] = False
+    """
+    Receive text frames as raw bytes, skipping UTF-8 decoding and validation.
+    Only enable for trusted (usually local) servers.
+    """
+
+    COMPRESSION: ClassVar[Optional[str]] = "deflate"
+    """
+    WebSocket compression extension to negotiate, or None to disable it.
+    Disable for local servers, where compressing costs more CPU than it saves.
+    """
+
     _ws: Optional[websockets.ClientConnection] = None
 
+    # Outgoing messages, sent in order by _sender_loop
+    _out_queue: asyncio.Queue[OutMessage]
+    _out_closed: bool = True  # Set once _sender_loop stops; sendnow() then refuses messages
+
     def __init__(self, manager: ConnectorManager):
         super().__init__(manager)
 
@@ -350,32 +479,132 @@ class WebSocketConnector(BaseConnector):
         """Return the URL to connect to."""
         ...
 
-    def _create_connection(self) -> websockets.connect:
-        return websockets.connect(self._get_url())
+    def _create_connection(self, **kwargs: Any) -> websockets.connect:
+        kwargs.setdefault("compression", self.COMPRESSION)
+        kwargs.setdefault("max_queue", RECV_QUEUE_SIZE)
+
+        return websockets.connect(self._get_url(), **kwargs)
 
     @asynccontextmanager
     async def connect(self):
         async with self._create_connection() as ws:
             self._ws = ws
-            yield
+            self._out_queue = queue = asyncio.Queue()
+            self._out_closed = False
+
+            sender = asyncio.create_task(self._sender_loop(ws, queue))
+            try:
+                yield
+            finally:
+                sender.cancel()
+                await asyncio.wait((sender,))
+
+                # In case the sender was cancelled before it started
+                self._close_out_queue(queue)
+
+    async def _sender_loop(
+        self,
+        ws: websockets.ClientConnection,
+        queue: asyncio.Queue[OutMessage],
+    ):
+        """
+        Send queued messages in order for the lifetime of a connection.
+        Messages queued in the meantime are taken in batches of up to
+        SEND_BATCH_SIZE and written back-to-back without waiting on the queue.
+        Messages left unsent when the connection ends are reported as failed.
+        """
+        pending: deque[OutMessage] = deque()
+
+        try:
+            while True:
+                pending.append(await queue.get())
+                while len(pending) < SEND_BATCH_SIZE:
+                    try:
+                        pending.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                debug = self.logger.isEnabledFor(logging.DEBUG)
+                while pending:
+                    data, text, sent = pending[0]
+
+                    try:
+                        await ws.send(data, text=text)
+                    except websockets.ConnectionClosed:
+                        raise
+                    except Exception:
+                        self.logger.exception("Exception sending WebSocket message: %s", data)
+                        success = False
+                    else:
+                        success = True
+                        if debug:
+                            self.logger.debug("Sent: %s", data)
+
+                    pending.popleft()
+                    if not sent.done():
+                        sent.set_result(success)
+
+        except websockets.ConnectionClosed:
+            # Reported by main_loop
+            pass
+
+        finally:
+            self._close_out_queue(queue, pending)
+
+    def _close_out_queue(
+        self,
+        queue: asyncio.Queue[OutMessage],
+        pending: Iterable[OutMessage] = (),
+    ):
+        """Refuse further messages, and fail the ones not sent yet."""
+        self._out_closed = True
+
+        unsent = list(pending)
+        while True:
+            try:
+                unsent.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        for _, _, sent in unsent:
+            if not sent.done():
+                sent.set_result(False)
 
     async def main_loop(self):
         if not self._ws:
             return
 
         try:
-            async for message in self._ws:
+            async for message in self._iter_messages():
                 try:
                     data = self._parse_message(message)
                     await self.on_message(data)
                 except asyncio.CancelledError:
                     raise
+                except json.JSONDecodeError as e:
+                    self.logger.warning("Received invalid JSON: %s", e)
                 except Exception:
                     self.logger.exception("Exception processing WebSocket message")
 
         except websockets.ConnectionClosedError as e:
             self.logger.warning("Connection closed in %s: %s", type(self).__name__, e)
 
+    async def _iter_messages(self):
+        """
+        Iterate over incoming messages, straight from the connection's own
+        receive buffer (see RECV_QUEUE_SIZE).
+        """
+        assert self._ws is not None
+
+        recv = self._ws.recv
+        decode = False if self.SKIP_UTF8_VALIDATION else None
+
+        try:
+            while True:
+                yield await recv(decode=decode)
+        except websockets.ConnectionClosedOK:
+            pass
+
     def _parse_message(self, message) -> Any:
         """Parse a message from the WebSocket."""
         return json.loads(message)
@@ -393,7 +622,8 @@ class WebSocketConnector(BaseConnector):
             await super().on_error(error)
 
     async def talk_receive(self, msg: ConnectorMessage) -> bool:
-        self.logger.debug("Connector message received: %r, data: %s", msg, msg.data)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Connector message received: %r, data: %s", msg, msg.data)
 
         if msg.action == "raw":
             await self.sendnow(msg.data)
@@ -401,15 +631,25 @@ class WebSocketConnector(BaseConnector):
 
         return False
 
-    async def sendnow(self, data: Any) -> bool:
-        """Direct send to this connector."""
-        if not self._connected or not self._ws:
+    async def sendnow(self, data: Any, text: bool | None = None) -> bool:
+        """
+        Direct send to this connector, without going through the manager.
+        The message is queued and sent in order by a per-connection sender task;
+        returns whether it was written to the connection.
+
+        str and bytes are sent as-is, as text or binary frames respectively,
+        unless `text` says otherwise; pass pre-encoded JSON with `text=True`.
+        Anything else is JSON-encoded and sent as a text frame.
+        """
+        # Refused once the connection's sender task has stopped
+        if not self._connected or not self._ws or self._out_closed:
             return False
 
         if not isinstance(data, (str, bytes)):
+            # Encoded straight to UTF-8 bytes; send them as a text frame
             data = json.dumps(data)
+            text = True
 
-        await self._ws.send(data)
-
-        self.logger.debug("Sent: %s", data)
-        return True
+        sent = asyncio.get_running_loop().create_future()
+        self._out_queue.put_nowait((data, text, sent))
+        return await sent
@@ -1,22 +1,32 @@
 from typing import (
-    NamedTuple, ClassVar, Any, Union,
-    Coroutine, Collection, Iterator, Iterable,
+    TYPE_CHECKING, NamedTuple, ClassVar, Any, Union,
+    Coroutine, AbstractSet, Iterator, Iterable,
 )
 from enum import IntEnum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from contextlib import asynccontextmanager
+from collections import deque
 import os
+import re
 import asyncio
+import itertools
 import random
-from datetime import datetime, timedelta
+import time
+import websockets
 
 from buttplug import (
     Client, WebsocketConnector, ProtocolSpec,
     ServerNotFoundError, DisconnectedError, ConnectorError, DeviceServerError,
 )
 
+if TYPE_CHECKING:
+    from buttplug.client import Actuator, Device
+
 from app.settings import getenv_list
-from app.connector import ConnectorMessage, ConnectorManager, BaseConnector
+from app.utils import json
+from app.connector import (
+    ConnectorMessage, ConnectorManager, BaseConnector, WebSocketConnector,
+)
 from app.utils.asyncio import async_select
 
 
@@ -25,7 +35,7 @@ from app.utils.asyncio import async_select
 
 ADD_FAKE_DEVICE = False  # Add fake device for testing
 CHAT_VIBE_INFO = False
-VIBE_CHECK_INTERVAL = 0.1
+VIBE_QUEUE_MAXSIZE = 64  # New groups are rejected beyond this
 
 WS_HOST = os.getenv("BUTTPLUG_WS_HOST")
 assert WS_HOST, "Missing environment variable: BUTTPLUG_WS_HOST"
@@ -134,11 +144,23 @@ def parse_vibes(
         if not cur_intensities:
             return False
 
-        # Normalize to at least 2 segments
-        segments = cur_intensities if len(cur_intensities) > 1 else [cur_intensities[0], cur_intensities[0]]
+        def make_action(duration: float, intensity: float) -> VibeFrame:
+            if not cur_devices:
+                return VibeFrame.new_override(duration, intensity)
+
+            return VibeFrame.new_exclusive(
+                duration,
+                (VibeTarget(x, intensity) for x in cur_devices),
+            )
 
+        segments = cur_intensities
         seg_count = len(segments) - 1
-        seg_duration = cur_duration / seg_count
+
+        # A single intensity has no ramp; emit it as one frame
+        if not seg_count:
+            cur_section.append(make_action(cur_duration, segments[0]))
+
+        seg_duration = cur_duration / seg_count if seg_count else cur_duration
 
         for seg_idx in range(seg_count):
             start = segments[seg_idx]
@@ -150,25 +172,18 @@ def parse_vibes(
                 seg_duration / 0.2,
             )))
 
-            step_intensity = (stop - start) / (count - 1) if count > 1 else 0
             step_duration = seg_duration / count
 
-            # If flat, use midpoint
-            if step_intensity == 0:
-                start = (start + stop) / 2
-
-            for i in range(count):
-                intensity = start + step_intensity * i
-
-                if not cur_devices:
-                    action = VibeFrame.new_override(step_duration, intensity)
-                else:
-                    action = VibeFrame.new_exclusive(
-                        step_duration,
-                        (VibeTarget(x, intensity) for x in cur_devices),
-                    )
+            # If flat (too short to ramp), use midpoint
+            if count == 1:
+                cur_section.append(make_action(step_duration, (start + stop) / 2))
+                continue
 
-                cur_section.append(action)
+            step_intensity = (stop - start) / (count - 1)
+            cur_section.extend(
+                make_action(step_duration, start + step_intensity * i)
+                for i in range(count)
+            )
 
         # Update previous values
         prev_intensities = tuple(cur_intensities)
@@ -255,7 +270,7 @@ def parse_vibes(
             except ValueError as e:
                 raise ValueError(f"{e}; in {arg!r}")
 
-        elif any(arg.endswith(x) for x in "xr"):  # Repeat the last section
+        elif arg[-1] in "xr":  # Repeat the last section
             # Note: If current section is empty, the previous section will be used instead
             flush_cur_section()
             if not sections:
@@ -270,10 +285,11 @@ def parse_vibes(
                 except ValueError:
                     raise ValueError(f"Invalid repeat format {arg!r}")
 
-            for _ in range(min(100, repeat)):
-                sections.append(prev_section)
+            # NOTE: Sections are immutable tuples, so repeats share one reference;
+            #       flattening below stops as soon as max_duration is reached
+            sections.extend(itertools.repeat(prev_section, min(100, repeat)))
 
-        elif any(arg.endswith(x) for x in "Sdt"):  # Repeat for the given duration
+        elif arg[-1] in "Sdt":  # Repeat for the given duration
             # Note: If current section is empty, the previous section will be used instead
             flush_cur_section()
             if not sections:
@@ -289,10 +305,11 @@ def parse_vibes(
 
             old_section = sections.pop()
             old_duration = sum(action.duration for action in old_section)
-            if old_duration <= 0 or duration / old_duration < 0.01:
-                ValueError(
-                    f"Section duration ({old_duration}s) is too short for "
-                    f"requested repeat duration ({duration}s)"
+            # Limit to 100 repeats of the section
+            if old_duration <= 0 or old_duration / duration < 0.01:
+                raise ValueError(
+                    f"Section duration ({old_duration}s) is less than 1% of "
+                    f"the requested repeat duration ({duration}s)"
                 )
 
             time = 0
@@ -333,40 +350,31 @@ def parse_vibes(
     if not sections:
         raise ValueError("No actions specified")
 
-    # If there are no sections, there is nothing to do
-    if not sections:
-        return tuple()
-
     # Flatten, limit duration and return
     vibes = []
     total_duration: float = 0
-    stop = False
-    for section in sections:
-        for action in section:
-            if action.duration <= 0:
-                continue
+    for action in itertools.chain.from_iterable(sections):
+        if action.duration <= 0:
+            continue
 
-            total_duration += action.duration
+        total_duration += action.duration
 
-            overflow_duration = total_duration - max_duration
-            if overflow_duration > 0:
-                stop = True
-                action = VibeFrame(
-                    duration=action.duration - overflow_duration,
-                    intensity=action.intensity,
-                    targets=action.targets,
-                    mode=action.mode,
-                )
+        overflow_duration = total_duration - max_duration
+        if overflow_duration > 0:
+            action = VibeFrame(
+                duration=action.duration - overflow_duration,
+                intensity=action.intensity,
+                targets=action.targets,
+                mode=action.mode,
+            )
 
             if action.duration > 0:
                 vibes.append(action)
 
-            if stop:
-                break
-
-        if stop:
             break
 
+        vibes.append(action)
+
     return tuple(vibes)
 
 
@@ -377,6 +385,8 @@ class VibeTargetMode(IntEnum):
     OVERRIDE = 0
     EXCLUSIVE = 1
 
+NO_DEVICES: frozenset[str] = frozenset()
+
 class VibeTarget(NamedTuple):
     device: str
     intensity: float
@@ -391,6 +401,8 @@ class VibeFrame:
     targets: tuple[VibeTarget, ...] = tuple()
     mode: VibeTargetMode = VibeTargetMode.OVERRIDE
 
+    _devices: frozenset[str] = field(init=False, repr=False, compare=False)
+
     @classmethod
     def new_override(
         cls,
@@ -422,6 +434,10 @@ class VibeFrame:
         if self.mode == VibeTargetMode.EXCLUSIVE and not self.targets:
             raise ValueError("Exclusive frame must have targets")
 
+        # NOTE: Most frames are overrides without targets; share one empty set for those
+        devices = frozenset(x.device for x in self.targets) if self.targets else NO_DEVICES
+        object.__setattr__(self, "_devices", devices)
+
     def __str__(self) -> str:
         if self.mode == VibeTargetMode.OVERRIDE:
             return (
@@ -456,13 +472,13 @@ class VibeFrame:
     def is_exclusive(self) -> bool:
         return self.mode == VibeTargetMode.EXCLUSIVE
 
-    def get_devices(self) -> set[str]:
-        return {x.device for x in self.targets}
+    def get_devices(self) -> frozenset[str]:
+        return self._devices
 
-    def resolve_devices(self, all_devices: Iterable[str]) -> set[str]:
+    def resolve_devices(self, all_devices: frozenset[str]) -> frozenset[str]:
         return (
-            set(all_devices) if self.is_override else
-            set(x.device for x in self.targets if x.device in all_devices)
+            all_devices if self.is_override else
+            self._devices & all_devices
         )
 
 @dataclass(frozen=True, slots=True)
@@ -472,6 +488,11 @@ class VibeGroup:
     channel_id: str | None = None
     username: str | None = None
 
+    _duration: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_duration", sum(item.duration for item in self.frames))
+
     def __str__(self) -> str:
         return (
             f"<{self.__class__.__name__}"
@@ -493,7 +514,7 @@ class VibeGroup:
         return iter(self.frames)
 
     def get_duration(self) -> float:
-        return sum(item.duration for item in self)
+        return self._duration
 
 
 # ==============================================================================
@@ -505,17 +526,30 @@ class ButtplugConnector(BaseConnector):
     client: Client
 
     _device_cache: set[str]
-
-    _vibe_queue: asyncio.Queue[VibeGroup]
+    _device_objs: tuple["Device", ...] | None = None
+    """Client device objects the device cache was last built from"""
+    _available_devices: frozenset[str]
+    _actuators_by_name: dict[str, list["Actuator"]]
+    _last_intensity: dict[str, float]
+    """Last intensity successfully sent per device name"""
+
+    # Single consumer (_vibe_loop); _vibe_ready is set whenever a group is added
+    _vibe_queue: deque[VibeGroup]
+    _vibe_ready: asyncio.Event
     _cur_vibe_group: VibeGroup | None = None
-    _delayed_until: datetime
+    _delayed_until: float
+    """Monotonic deadline (see `time.monotonic`) until which vibing is delayed"""
 
     def __init__(self, manager: ConnectorManager):
         super().__init__(manager)
         self.client = self._create_client()
         self._device_cache = set()
-        self._vibe_queue = asyncio.Queue()
-        self._delayed_until = datetime.now()
+        self._available_devices = frozenset()
+        self._actuators_by_name = {}
+        self._last_intensity = {}
+        self._vibe_queue = deque()
+        self._vibe_ready = asyncio.Event()
+        self._delayed_until = 0.0
 
     def _create_client(self) -> Client:
         logger = self.logger.getChild("Client")
@@ -529,6 +563,7 @@ class ButtplugConnector(BaseConnector):
         try:
             self.connector = self._create_connection()
             await self.client.connect(self.connector)
+            self._last_intensity.clear()  # Devices start out in an unknown state
             yield
         finally:
             asyncio.create_task(self.__try_disconnect())
@@ -572,8 +607,8 @@ class ButtplugConnector(BaseConnector):
         else:
             return await super().on_error(error)
 
-    def _get_devices(self) -> set[str]:
-        return set(
+    def _get_devices(self) -> frozenset[str]:
+        return frozenset(
             x.name
             for x in self.client.devices.values()
             if x.name not in DEVICE_BLACKLIST
@@ -588,33 +623,48 @@ class ButtplugConnector(BaseConnector):
 
     async def enqueue(self, vibe: VibeGroup | VibeFrame) -> None:
         group = vibe if isinstance(vibe, VibeGroup) else VibeGroup((vibe,))
-        await self._vibe_queue.put(group)
+
+        # Reject rather than evict, so queued (possibly paid) groups are never lost silently
+        if len(self._vibe_queue) >= VIBE_QUEUE_MAXSIZE:
+            self.logger.warning(
+                "Vibe queue full, rejecting %s by %s",
+                group, group.username or "unknown",
+            )
+            self.talkto_nowait("JoystickTV", "chat", {
+                "text": f"Vibe: queue full, could not queue vibe by {group.username or 'unknown'}",
+                "channelId": group.channel_id or "",
+            })
+            return
+
+        self._vibe_queue.append(group)
+        self._vibe_ready.set()
 
     async def clear(self) -> None:
-        try:
-            while True:
-                self._vibe_queue.get_nowait()
-        except asyncio.QueueEmpty:
-            pass
+        self._vibe_queue.clear()
 
         self._cur_vibe_group = None
 
-        await self._vibe([x.name for x in self.client.devices.values()], 0)
+        # Pick up devices that (re)connected since the last refresh, so none are missed
+        await self._update_device_cache()
+
+        # Always send the stop, whatever state we think the devices are in
+        await self._vibe({x.name for x in self.client.devices.values()}, 0, force=True)
 
     async def skip(self) -> None:
         self._cur_vibe_group = None
 
     async def delay(self, seconds: float) -> None:
-        now = datetime.now()
-        until = now + timedelta(seconds=seconds)
+        from app.routes.ws import vibegraph
+
+        until = time.monotonic() + seconds
         self._delayed_until = max(self._delayed_until, until)
+        vibegraph.state_changed.set()
 
         group = self._cur_vibe_group
         if group:
-            delay = (until - now).total_seconds()
-            log_msg = f"Vibe: disabled for {delay:.1f} seconds"
+            log_msg = f"Vibe: disabled for {seconds:.1f} seconds"
             self.logger.info(log_msg)
-            await self.talkto("JoystickTV", "chat", {
+            self.talkto_nowait("JoystickTV", "chat", {
                 "text": log_msg,
                 "channelId": group.channel_id or "",
             })
@@ -633,107 +683,133 @@ class ButtplugConnector(BaseConnector):
         await self._update_device_cache()
         self.logger.info("Device-scan complete")
 
-        shutdown = False
-        while not shutdown:
-            tshutdown = asyncio.create_task(self._shutdown.wait())
-            tsleep = asyncio.create_task(asyncio.sleep(5))
-
-            done = await async_select(tshutdown, tsleep)
-            shutdown = tshutdown in done
-            if shutdown:
-                break
-
-            await self._update_device_cache()
+        while not self._shutdown.is_set():
+            try:
+                async with asyncio.timeout(5):
+                    await self._shutdown.wait()
+            except TimeoutError:
+                await self._update_device_cache()
 
     async def _vibe_loop(self):
         from app.routes.ws import vibegraph
 
-        devices: set[str] = set()
-
-        shutdown = False
-        while not shutdown:
-            tshutdown = asyncio.create_task(self._shutdown.wait())
-            tqueue = asyncio.create_task(self._vibe_queue.get())
+        devices: frozenset[str] = frozenset()
+        idle = True  # No group ran since the queue last drained
 
-            done = await async_select(tshutdown, tqueue)
-            shutdown = tshutdown in done
-            if shutdown:
-                break
+        # NOTE: One long-lived shutdown waiter for the whole loop
+        tshutdown = asyncio.create_task(self._shutdown.wait())
+        try:
+            shutdown = False
+            while not shutdown:
+                group = await self._next_vibe_group(tshutdown)
+                if group is None:
+                    break
 
-            group = self._cur_vibe_group = tqueue.result()
+                self._cur_vibe_group = group
 
-            self.logger.info("VibeGroup: %s; queue remaining: %d", group, self._vibe_queue.qsize())
+                self.logger.info("VibeGroup: %s; queue remaining: %d", group, len(self._vibe_queue))
 
-            if not group:
-                continue
+                if not group:
+                    continue
 
-            await self._update_device_cache()
-            await vibegraph.bcast_update_devices(self._device_cache)
-            await vibegraph.bcast_set_group(group)
+                # Refresh devices once per burst of queued groups;
+                # the scan loop keeps them current in between
+                if idle:
+                    idle = False
+                    # Broadcast anyway so newly connected clients get the devices too
+                    if not await self._update_device_cache():
+                        await vibegraph.bcast_update_devices(self._device_cache)
+
+                await vibegraph.bcast_set_group(group)
+
+                for i, vibe in enumerate(x for x in group.frames if x):
+                    shutdown = await self._handle_vibe_frame(devices, group, None)
+                    if shutdown:
+                        break
+
+                    if group is not self._cur_vibe_group:
+                        break
+
+                    # NOTE: Override frames resolve to the shared available-device set,
+                    #       which is only replaced when it changes
+                    new_devices = vibe.resolve_devices(self._available_devices)
+                    if new_devices is not devices:
+                        old_devices = devices - new_devices
+                        devices = new_devices
+
+                        if old_devices:
+                            await self._vibe(old_devices, 0)
+
+                    self.logger.debug("VibeFrame: %r", vibe)
+
+                    if CHAT_VIBE_INFO and i == 0:
+                        count = len(group)
+                        at = f" at {round(vibe.intensity*100)}%" if count == 1 else ""
+                        self.talkto_nowait("JoystickTV", "chat", {
+                            "text": (
+                                f"Vibe: {count} items for {round(group.get_duration())}s{at}"
+                                f" by {group.username or 'unknown'}; queued: {len(self._vibe_queue)}"
+                            ),
+                            "channelId": group.channel_id or "",
+                        })
+
+                    await asyncio.gather(
+                        self._handle_vibe_frame(devices, group, vibe),
+                        vibegraph.bcast_advance(vibe.duration),
+                    )
 
-            for i, vibe in enumerate(x for x in group.frames if x):
-                shutdown = await self._handle_vibe_frame(devices, group, None)
                 if shutdown:
+                    await self._vibe(devices, 0)
                     break
 
-                if group is not self._cur_vibe_group:
-                    break
+                if self._vibe_queue:
+                    continue
 
-                all_devices = self._get_devices()
-                new_devices = vibe.resolve_devices(all_devices)
-                old_devices = devices - new_devices
-                devices = new_devices
-
-                if old_devices:
-                    await self._vibe(old_devices, 0)
-
-                self.logger.debug("VibeFrame: %r", vibe)
-
-                if i == 0 and CHAT_VIBE_INFO:
-                    await self.talkto("JoystickTV", "chat", {
-                        "text": (
-                            f"Vibe: {len(group)} items for {round(group.get_duration())}s"
-                            + (f" at {round(vibe.intensity*100)}%" if len(group) == 1 else "")
-                            + f" by {group.username or 'unknown'}"
-                            + f"; queued: {self._vibe_queue.qsize()}"
-                        ),
-                        "channelId": group.channel_id or "",
-                    })
+                idle = True
+                await self._on_queue_empty(devices, group)
+        finally:
+            tshutdown.cancel()
 
-                await asyncio.gather(
-                    self._handle_vibe_frame(devices, group, vibe),
-                    vibegraph.bcast_advance(vibe.duration),
-                )
+    async def _on_queue_empty(self, devices: AbstractSet[str], group: VibeGroup) -> None:
+        """Stop all devices and reset clients after the last queued group."""
+        from app.routes.ws import vibegraph
 
-            self._vibe_queue.task_done()
+        if CHAT_VIBE_INFO:
+            msg = "Vibe: queue is empty"
+            self.logger.info(msg)
+            self.talkto_nowait("JoystickTV", "chat", {
+                "text": msg,
+                "channelId": group.channel_id or "",
+            })
 
-            if shutdown:
-                await self._vibe(devices, 0)
-                break
+        # NOTE: _vibe returns early when there is nothing to stop
+        await asyncio.gather(
+            vibegraph.bcast_reset_group(),
+            self._vibe(devices, 0),
+        )
 
-            if not self._vibe_queue.empty():
-                continue
+    async def _next_vibe_group(self, tshutdown: asyncio.Task[Any]) -> VibeGroup | None:
+        """Wait for the next queued VibeGroup. Returns None once shut down."""
+        if tshutdown.done():
+            return None
 
-            tasks = [
-                vibegraph.bcast_reset_group(),
-            ]
+        while not self._vibe_queue:
+            self._vibe_ready.clear()
 
-            if devices:
-                tasks.append(self._vibe(devices, 0))
+            tready = asyncio.create_task(self._vibe_ready.wait())
+            try:
+                await asyncio.wait((tshutdown, tready), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                tready.cancel()
 
-            if CHAT_VIBE_INFO:
-                msg = "Vibe: queue is empty"
-                self.logger.info(msg)
-                tasks.append(self.talkto("JoystickTV", "chat", {
-                    "text": msg,
-                    "channelId": group.channel_id or "",
-                }))
+            if tshutdown.done():
+                return None
 
-            await asyncio.gather(*tasks)
+        return self._vibe_queue.popleft()
 
     async def _handle_vibe_frame(
         self,
-        devices: Collection[str],
+        devices: AbstractSet[str],
         group: VibeGroup,
         vibe: VibeFrame | None,
     ) -> bool:
@@ -744,33 +820,32 @@ class ButtplugConnector(BaseConnector):
         active = False
         mult = 1.0
 
-        async def wait_for_shutdown(timeout: float):
-            nonlocal shutdown
-            shutdown = await self._wait_for_shutdown(timeout)
-
         while not shutdown:
-            tasks: list[Coroutine[Any, Any, None]] = []
-            now = datetime.now()
-            delay: float = 0
+            # Any change from here on wakes the wait below early
+            vibegraph.state_changed.clear()
+
+            tasks: list[Coroutine[Any, Any, Any]] = []
+            now = time.monotonic()
+            delay: float | None = 0
+            vibing = False
 
             if vibegraph.config.paused:
-                delay = VIBE_CHECK_INTERVAL
+                delay = None  # Until unpaused
 
                 if vibe is not None and active:
                     active = False
                     tasks.append(self._vibe(devices, 0))
 
             elif self._delayed_until > now:
-                total_delay = (self._delayed_until - now).total_seconds()
-                delay = min(total_delay, VIBE_CHECK_INTERVAL)
+                delay = self._delayed_until - now
 
                 if vibe is not None and active:
                     active = False
                     tasks.append(self._vibe(devices, 0))
 
             elif vibe_delay > 0:
-                delay = min(vibe_delay, VIBE_CHECK_INTERVAL)
-                vibe_delay -= delay
+                delay = vibe_delay
+                vibing = True
 
                 if vibe is not None:
                     new_mult = vibegraph.config.strength / 100
@@ -779,13 +854,20 @@ class ButtplugConnector(BaseConnector):
                         mult = new_mult
                         tasks.append(self._vibe(devices, vibe.intensity * mult))
 
-            if delay <= 0:
+            if delay is not None and delay <= 0:
                 break
 
-            await asyncio.gather(
-                wait_for_shutdown(delay),
-                *tasks,
-            )
+            if not tasks:
+                shutdown = await self._wait_for_change(delay)
+            else:
+                shutdown, *_ = await asyncio.gather(
+                    self._wait_for_change(delay),
+                    *tasks,
+                )
+
+            # Only time spent vibing counts towards the frame
+            if vibing:
+                vibe_delay -= time.monotonic() - now
 
             if shutdown:
                 break
@@ -797,50 +879,107 @@ class ButtplugConnector(BaseConnector):
 
         return shutdown
 
-    async def _wait_for_shutdown(self, timeout: float) -> bool:
+    async def _wait_for_change(self, timeout: float | None) -> bool:
+        """
+        Wait until the timeout passes, the vibe state changes or we shut down.
+        Returns whether we are shutting down.
+        """
+        from app.routes.ws import vibegraph
+
+        tchanged = asyncio.create_task(vibegraph.state_changed.wait())
         tshutdown = asyncio.create_task(self._shutdown.wait())
-        tsleep = asyncio.create_task(asyncio.sleep(timeout))
+        try:
+            await asyncio.wait(
+                (tchanged, tshutdown),
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            tchanged.cancel()
+            tshutdown.cancel()
 
-        done = await async_select(tshutdown, tsleep)
-        return tshutdown in done
+        return self._shutdown.is_set()
 
-    async def _update_device_cache(self) -> set[str]:
+    async def _update_device_cache(self) -> bool:
+        """Refresh the device cache, broadcasting it if it changed. Returns whether it did."""
         from app.routes.ws import vibegraph
-        devices = self._get_devices()
 
+        # A reconnecting device gets a new object, so if the device objects
+        # are all the same ones as last time, nothing can have changed
+        device_objs = tuple(self.client.devices.values())
+        if device_objs == self._device_objs:
+            return False
+
+        self._device_objs = device_objs
+        self._last_intensity.clear()  # Reconnected devices start out in an unknown state
+
+        # Rebuilt on change, as a reconnecting device gets new actuator objects
+        actuators_by_name: dict[str, list["Actuator"]] = {}
+        for device in device_objs:
+            actuators_by_name.setdefault(device.name, []).extend(device.actuators)
+        self._actuators_by_name = actuators_by_name
+
+        available = self._get_devices()
+
+        # Keep the same object while unchanged, so users can compare by identity
+        if available != self._available_devices:
+            self._available_devices = available
+
+        devices = set(available)
         if ADD_FAKE_DEVICE:
             devices.add("Fake Device")
 
-        if devices != self._device_cache:
-            self._device_cache = devices
-            self.logger.info("Devices updated: %s", devices)
-            await vibegraph.bcast_update_devices(devices)
+        if devices == self._device_cache:
+            return False
 
-        return devices
+        self._device_cache = devices
+        self.logger.info("Devices updated: %s", devices)
+        await vibegraph.bcast_update_devices(devices)
+        return True
 
-    async def _vibe(self, device_names: Collection[str], intensity: float):
-        if not device_names:
+    async def _vibe(self, device_names: AbstractSet[str], intensity: float, force: bool = False):
+        """
+        Set the intensity of the given devices.
+        Devices already at this intensity are skipped, unless `force` is set.
+        """
+        last_intensity = self._last_intensity
+        if force:
+            names = list(device_names)
+        else:
+            names = [x for x in device_names if last_intensity.get(x) != intensity]
+        if not names:
             return
 
-        for device in self.client.devices.values():
-            if device.name not in device_names:
+        # Send all actuator commands at once instead of one round-trip at a time
+        actuators_by_name = self._actuators_by_name
+        commands = [
+            (name, actuator.command(intensity))
+            for name in names
+            for actuator in actuators_by_name.get(name, ())
+        ]
+        results = await asyncio.gather(*(x for _, x in commands), return_exceptions=True)
+
+        # Only devices that were actually commanded are known to be at this intensity
+        for name, _ in commands:
+            last_intensity[name] = intensity
+
+        error: BaseException | None = None
+        for (name, _), result in zip(commands, results):
+            if not isinstance(result, BaseException):
                 continue
 
-            for actuator in device.actuators:
-                try:
-                    await actuator.command(intensity)
-                except (DisconnectedError, DeviceServerError):
-                    pass
+            # Unknown state; send again next time
+            last_intensity.pop(name, None)
 
+            if not isinstance(result, (DisconnectedError, DeviceServerError)):
+                error = error or result
 
-# ==============================================================================
-# Buttplug Proxy Connector
+        if error is not None:
+            raise error
 
-import itertools
-import json
-import websockets
 
-from app.connector import WebSocketConnector
+# ==============================================================================
+# Buttplug Proxy Connector
 
 IntifaceMessage = list[dict[str, Any]]
 
@@ -960,6 +1099,8 @@ class ButtplugProxyClients:
 
 class ButtplugProxyConnector(WebSocketConnector):
     NAME: ClassVar[str] = "ButtplugProxy"
+    SKIP_UTF8_VALIDATION: ClassVar[bool] = True
+    COMPRESSION: ClassVar[str | None] = None
 
     clients: ButtplugProxyClients
 
@@ -996,7 +1137,10 @@ class ButtplugProxyConnector(WebSocketConnector):
         )
 
     async def _server_loop(self) -> None:
-        async with websockets.serve(self.handle_client, PROXY_HOST, PROXY_PORT):
+        async with websockets.serve(
+            self.handle_client, PROXY_HOST, PROXY_PORT,
+            compression=None,
+        ):
             self.logger.info((
                 "Buttplug proxy listening on %s:%d"
             ), PROXY_HOST, PROXY_PORT)
@@ -1104,7 +1248,7 @@ class ButtplugProxyConnector(WebSocketConnector):
         if immediate_reply:
             self.logger.debug("[P -> C]: %s", immediate_reply)
             msg = json.dumps(immediate_reply)
-            await client.send(msg)
+            await client.send(msg, text=True)
 
     async def on_server_message(self, data: Any) -> None:
         if not isinstance(data, list):
@@ -1188,7 +1332,7 @@ class ButtplugProxyConnector(WebSocketConnector):
             for client, reply in replies.items():
                 try:
                     msg = json.dumps(reply)
-                    await client.send(msg)
+                    await client.send(msg, text=True)
                 except websockets.ConnectionClosedError:
                     self.logger.debug("Client closed, skipping reply")
                 except Exception as e:
@@ -1204,7 +1348,7 @@ class ButtplugProxyConnector(WebSocketConnector):
             else:
                 for client_info in self.clients.iter_clients():
                     try:
-                        await client_info.client.send(msg)
+                        await client_info.client.send(msg, text=True)
                     except websockets.ConnectionClosedError:
                         self.logger.debug("Client closed, skipping broadcast")
                     except Exception as e:
@@ -1214,12 +1358,13 @@ class ButtplugProxyConnector(WebSocketConnector):
 # ==============================================================================
 # Buttplug Receiver Connector
 
-import re
-
-from app.connector import WebSocketConnector
+# Lovense vibrate command; the level ranges from 0 to 20
+LOVENSE_VIBRATE_PATTERN = re.compile(rb"Vibrate:([0-9]+)")
 
 class ButtplugReceiverConnector(WebSocketConnector):
     NAME: ClassVar[str] = "ButtplugReceiver"
+    SKIP_UTF8_VALIDATION: ClassVar[bool] = True
+    COMPRESSION: ClassVar[str | None] = None
 
     FORWARD_TO_BUTTBLUG: bool = True
     FORWARD_TO_PISHOCK: bool = False
@@ -1301,7 +1446,7 @@ class ButtplugReceiverConnector(WebSocketConnector):
             self.logger.info(f"Lovense command: {data}")
 
             # If it's a vibrate message, get the vibrate level, which will be 0-20.
-            m = re.search(rb"Vibrate:([0-9]+)", data)
+            m = LOVENSE_VIBRATE_PATTERN.search(data)
             if m:
                 await self.set_intensity(round(int(m.group(1)) / 20 * 100))
 
@@ -1,16 +1,17 @@
 from typing import ClassVar, Any, Iterable
 import asyncio
+from datetime import datetime, timedelta
 # import enum
 import logging
-import json
 import websockets
 import html
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.settings import getenv_list, POINTS_NAME
+from app.utils import json
+from app.utils.datetime import utcmin, utcnow
 from app.connector import ConnectorMessage, ConnectorManager, WebSocketConnector
-from app.connectors.warudo import QUIRKY_ANIMALS_MAP
 from app.handlers.jstv.commands import db as dbcmdhandlers
 from app.handlers.jstv.events import db as dbevhandlers
 
@@ -22,8 +23,6 @@ from app.jstv import jstv_db
 from app.jstv.jstv_web import WS_HOST, ACCESS_TOKEN
 from app.jstv import jstv_dbstate
 
-QUIRKY_ANIMALS_LIST = tuple(QUIRKY_ANIMALS_MAP.items())
-
 
 # ==============================================================================
 # Config
@@ -35,9 +34,29 @@ URL = f"{WS_HOST}?token={ACCESS_TOKEN}"
 
 SUBPROTOCOL_ACTIONABLE = websockets.Subprotocol("actioncable-v1-json")
 
+# Pre-encoded, constant gateway messages
+SUBSCRIBE_MESSAGE = json.dumps({"command": "subscribe", "identifier": GATEWAY_IDENTIFIER})
+
+# Everything of a gateway "message" command up to its data field (see encode_message)
+MESSAGE_PREFIX = json.dumps({"command": "message", "identifier": GATEWAY_IDENTIFIER})[:-1] + b',"data":'
+
+EVENT_TIME_SAVE_INTERVAL = timedelta(seconds=10)
+"""Minimum time between saving when the last server message was received"""
+
 VIP_USERS = tuple(x.casefold() for x in getenv_list("JOYSTICKTV_VIP_USERS"))
 
 
+# ==============================================================================
+# Functions
+
+def encode_message(data: dict[str, Any]) -> bytes:
+    """
+    Encode a gateway "message" command carrying `data`.
+    Only `data` is serialized; the rest of the command is a pre-encoded constant.
+    """
+    return MESSAGE_PREFIX + json.dumps(json.dumps_str(data)) + b"}"
+
+
 # ==============================================================================
 # Enums
 
@@ -51,13 +70,17 @@ VIP_USERS = tuple(x.casefold() for x in getenv_list("JOYSTICKTV_VIP_USERS"))
 # JoystickTV Connector
 
 class LiveChannel:
-    pass
+    __slots__ = ()
 
 class JoystickTVConnector(WebSocketConnector):
     NAME: ClassVar[str] = NAME
 
     live_channels: dict[str, LiveChannel]
 
+    # When the last server message was received, and when that was last saved
+    _event_time: datetime = utcmin
+    _event_time_saved: datetime = utcmin
+
     def __init__(self, manager: ConnectorManager):
         super().__init__(manager)
         self.live_channels = {}
@@ -65,10 +88,10 @@ class JoystickTVConnector(WebSocketConnector):
     def _get_url(self) -> str:
         return URL
 
-    def _create_connection(self) -> websockets.connect:
-        return websockets.connect(
-            self._get_url(),
+    def _create_connection(self, **kwargs: Any) -> websockets.connect:
+        return super()._create_connection(
             subprotocols=[SUBPROTOCOL_ACTIONABLE],
+            **kwargs,
         )
 
     async def talk_receive(self, msg: ConnectorMessage) -> bool:
@@ -84,26 +107,26 @@ class JoystickTVConnector(WebSocketConnector):
             if mention:
                 text = f"@{mention} {text}"
 
+            # NOTE: Escaping never adds or removes whitespace, so lines split the same
+            text = html.escape(text)
+
+            data = {
+                "action": "send_message",
+                "text": "",
+                "channelId": channelId,
+            }
+
+            if whisper:
+                data["action"] = "send_whisper"
+                data["username"] = whisper
+
             for line in text.split("\n"):
                 line = line.rstrip()
                 if not line:
                     continue
 
-                data = {
-                    "action": "send_message",
-                    "text": html.escape(line),
-                    "channelId": channelId,
-                }
-
-                if whisper:
-                    data["action"] = "send_whisper"
-                    data["username"] = whisper
-
-                await self.sendnow({
-                    "command": "message",
-                    "identifier": GATEWAY_IDENTIFIER,
-                    "data": json.dumps(data),
-                })
+                data["text"] = line
+                await self.sendnow(encode_message(data), text=True)
 
             return True
 
@@ -121,7 +144,7 @@ class JoystickTVConnector(WebSocketConnector):
 
         async with AsyncSessionMaker.begin() as db:
             await asyncio.gather(
-                self.sendnow({"command": "subscribe", "identifier": GATEWAY_IDENTIFIER}),
+                self.sendnow(SUBSCRIBE_MESSAGE, text=True),
                 self._update_live_channels(db),
             )
 
@@ -151,15 +174,34 @@ class JoystickTVConnector(WebSocketConnector):
         self.logger.info("Connection closed")
 
         async with AsyncSessionMaker.begin() as db:
+            await self._save_event_time(db)
             await jstv_dbstate.on_disconnected(db)
 
+    async def _save_event_time(self, db: AsyncSession) -> None:
+        """Save when the last server message was received, if not yet saved."""
+        if self._event_time <= self._event_time_saved:
+            return
+
+        self._event_time_saved = self._event_time
+        await jstv_dbstate.on_server_message(db, self._event_time)
+
     async def on_message(self, data: Any):
         if not isinstance(data, dict):
             self.logger.warning("Received non-dict message: %r", data)
             return
 
-        async with AsyncSessionMaker.begin() as db:
-            await jstv_dbstate.on_server_message(db)
+        # Saved at most every EVENT_TIME_SAVE_INTERVAL, and on disconnect;
+        # recovery only needs it to within MAX_SESSION_RECOVERY_TIME
+        # NOTE: Also used as the current time for all updates this message causes
+        now = self._event_time = utcnow()
+        if now - self._event_time_saved >= EVENT_TIME_SAVE_INTERVAL:
+            async with AsyncSessionMaker.begin() as db:
+                await self._save_event_time(db)
+
+        # Pings are the most frequent frames and carry nothing we use;
+        # route on the raw type key and skip validating them into models
+        if data.get("type") == evjstv.JSTVPingEvent.discriminator:
+            return
 
         try:
             event = evjstv.JSTVEvent.parse(data)
@@ -172,10 +214,6 @@ class JoystickTVConnector(WebSocketConnector):
         if isdebug:  # Log full event if debugging
             self.logger.debug("Received: %r", event)
 
-        if iscontrol:
-            if isinstance(event, evjstv.JSTVPingEvent):
-                return
-
         if not isdebug:  # Log summary event if not debugging
             self.logger.info("Received: %s", event)
 
@@ -211,7 +249,7 @@ class JoystickTVConnector(WebSocketConnector):
             await self.on_stream_resuming(evmsg)
 
         elif isinstance(evmsg, evjstv.JSTVNewChatMessage):
-            await self.on_new_chat(evmsg)
+            await self.on_new_chat(evmsg, now=now)
 
         elif isinstance(evmsg, evjstv.JSTVUserEnteredStream):
             await self.on_enter_stream(evmsg)
@@ -240,7 +278,7 @@ class JoystickTVConnector(WebSocketConnector):
             viewer = await jstv_db.get_or_create_viewer(db, channel, user) if user else None
 
             if viewer is not None:
-                await jstv_dbstate.on_viewer_interaction(db, channel, user, viewer)
+                await jstv_dbstate.on_viewer_interaction(db, channel, user, viewer, now=now)
 
             await dbevhandlers.invoke_events(
                 db=db,
@@ -285,7 +323,12 @@ class JoystickTVConnector(WebSocketConnector):
         async with AsyncSessionMaker.begin() as db:
             await jstv_dbstate.on_stream_ended(db, channel_id)
 
-    async def on_new_chat(self, evmsg: evjstv.JSTVNewChatMessage) -> None:
+    async def on_new_chat(
+        self,
+        evmsg: evjstv.JSTVNewChatMessage,
+        *,
+        now: datetime | None = None,
+    ) -> None:
         channel_id = evmsg.channelId
         username = evmsg.author.username
 
@@ -294,7 +337,7 @@ class JoystickTVConnector(WebSocketConnector):
             user = await jstv_db.get_or_create_user(db, username)
             viewer = await jstv_db.get_or_create_viewer(db, channel, user)
 
-            await jstv_dbstate.on_new_chat(db, channel, user, viewer)
+            await jstv_dbstate.on_new_chat(db, channel, user, viewer, now=now)
 
             # TODO: Move these viewer updates to jstv_dbstate somewhere
             viewer.is_streamer = evmsg.author.isStreamer
@@ -424,15 +467,15 @@ class JoystickTVConnector(WebSocketConnector):
         mention: str | None = None,
         whisper: str | None = None,
     ):
-        await asyncio.gather(*[
-            self.send_chat(
+        # NOTE: Queued in order; talk() never waits (see ConnectorManager.talkto).
+        #       Snapshot the IDs anyway, in case a live dict view is passed.
+        for channel_id in tuple(channel_ids):
+            await self.send_chat(
                 channel_id,
                 text,
                 mention=mention,
                 whisper=whisper,
             )
-            for channel_id in channel_ids
-        ])
 
     async def send_live_chats(
         self,
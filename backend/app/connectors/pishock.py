@@ -6,7 +6,6 @@ import asyncio
 import httpx
 from datetime import datetime
 import os
-import re
 from json import JSONDecodeError
 import random
 
@@ -16,7 +15,6 @@ from app.connector import (
     ConnectorMessage, ConnectorManager, WebSocketConnector,
     ConnectorReconnect,
 )
-from app.utils.asyncio import async_select
 from app.utils.pydantic import FrozenBaseModel, LoggedBaseModel
 
 logger = logging.getLogger(__name__)
@@ -199,6 +197,38 @@ class ShockGroup:
 # ==============================================================================
 # Functions
 
+def _parse_int_range(source: str, *, suffix: str) -> int:
+    """Parse `N<suffix>` or `N[<suffix>]-M<suffix>` into a (random) integer."""
+    low, sep, high = source.removesuffix(suffix).partition("-")
+    low = low.removesuffix(suffix)
+
+    if not low.isdigit() or (sep and not high.isdigit()):
+        raise ValueError(f"Invalid range {source!r}")
+
+    if not sep:
+        return int(low)
+
+    return random.randint(int(low), int(high))
+
+def _is_decimal(source: str) -> bool:
+    """Whether `source` is plain digits with an optional single `.` between them."""
+    whole, dot, frac = source.partition(".")
+    return whole.isdigit() and (not dot or frac.isdigit())
+
+def _parse_float_range(source: str, *, suffix: str) -> float:
+    """Parse `N<suffix>` or `N[<suffix>]-M<suffix>` into a (random) float."""
+    low, sep, high = source.removesuffix(suffix).partition("-")
+    low = low.removesuffix(suffix)
+
+    # NOTE: Rejects what float() would otherwise accept, like "inf", "nan" and "1e9"
+    if not _is_decimal(low) or (sep and not _is_decimal(high)):
+        raise ValueError(f"Invalid range {source!r}")
+
+    if not sep:
+        return float(low)
+
+    return random.uniform(float(low), float(high))
+
 def parse_shocks(
     vibestr: str,
     *,
@@ -246,57 +276,27 @@ def parse_shocks(
                 raise ValueError(f"Currently only one intensity can be specified {arg!r}")
 
             try:
-                intensity = int(arg[:-1])
-                continue
+                intensity = _parse_int_range(arg, suffix="%")
             except ValueError:
-                pass
-
-            m = re.fullmatch(r"(\d+)%?-(\d+)%", arg)
-            if m:
-                low = int(m.group(1))
-                high = int(m.group(2) or low)
-                intensity = random.randint(low, high)
-                continue
-
-            raise ValueError(f"Invalid intensity format {arg!r}")
+                raise ValueError(f"Invalid intensity format {arg!r}")
 
         elif arg.endswith("s"):  # This is the duration in seconds
             if duration is not None:
                 raise ValueError(f"Currently only one duration can be specified {arg!r}")
 
             try:
-                duration = float(arg[:-1])
-                continue
+                duration = _parse_float_range(arg, suffix="s")
             except ValueError:
-                pass
-
-            m = re.fullmatch(r"((?:\d+?\.)?\d+)s?-((?:\d+?\.)?\d+)s", arg)
-            if m:
-                low = float(m.group(1))
-                high = float(m.group(2) or low)
-                duration = random.uniform(low, high)
-                continue
-
-            raise ValueError(f"Invalid duration format {arg!r}")
+                raise ValueError(f"Invalid duration format {arg!r}")
 
         # elif arg.endswith("w"):  # This is the duration after warning in seconds
         #     if warning is not None:
         #         raise ValueError(f"Currently only one warning duration can be specified {arg!r}")
 
         #     try:
-        #         warning = float(arg[:-1])
-        #         continue
+        #         warning = _parse_float_range(arg, suffix="w")
         #     except ValueError:
-        #         pass
-
-        #     m = re.fullmatch(r"((?:\d+?\.)?\d+)s?-((?:\d+?\.)?\d+)s", arg)
-        #     if m:
-        #         low = float(m.group(1))
-        #         high = float(m.group(2) or low)
-        #         warning = random.uniform(low, high)
-        #         continue
-
-        #     raise ValueError(f"Invalid warning format {arg!r}")
+        #         raise ValueError(f"Invalid warning format {arg!r}")
 
         else:  # Invalid argument
             raise ValueError(f"Invalid argument {arg!r}")
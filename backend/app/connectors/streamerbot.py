@@ -20,6 +20,8 @@ URL = WS_HOST
 
 class StreamerBotConnector(WebSocketConnector):
     NAME: ClassVar[str] = NAME
+    SKIP_UTF8_VALIDATION: ClassVar[bool] = True
+    COMPRESSION: ClassVar[str | None] = None
 
     def __init__(self, manager: ConnectorManager):
         super().__init__(manager)
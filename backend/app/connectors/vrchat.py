@@ -132,11 +132,13 @@ class VRChatConnector(BaseConnector):
     def __init__(self, manager: ConnectorManager):
         super().__init__(manager)
 
-        self._client = self._create_client()
-
         if ENABLE_SERVER:
             self._server = self._create_server()
 
+    async def setup(self):
+        # Creating the client resolves the host, which may block
+        self._client = await asyncio.to_thread(self._create_client)
+
     def _create_client(self) -> SimpleUDPClient:
         return SimpleUDPClient(*parse_hostport(CLIENT_HOST))
 
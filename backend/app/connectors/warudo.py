@@ -161,6 +161,8 @@ QUIRKY_ANIMALS_MAP: dict[str, str] = {
 
 class WarudoConnector(WebSocketConnector):
     NAME: ClassVar[str] = NAME
+    SKIP_UTF8_VALIDATION: ClassVar[bool] = True
+    COMPRESSION: ClassVar[str | None] = None
 
     def _get_url(self) -> str:
         return URL
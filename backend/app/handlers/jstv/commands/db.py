@@ -13,6 +13,7 @@ from app.connector import BaseConnector
 from app.events import jstv as evjstv
 from app.jstv import jstv_db, jstv_dbstate
 from app.db.database import AsyncSessionMaker
+from app.db.enums import AccessLevel
 from app.db.models import (
     Channel, User, Viewer,
     CommandDefinition, Command,
@@ -34,6 +35,12 @@ COMMAND_MAP = cast(Mapping[str, type[JSTVCommand]], JSTVCommand.handlers)
 STREAMER_EXEMPT = True
 
 
+# ==============================================================================
+# Constants
+
+MIN_ACCESS_LEVEL = min(AccessLevel)
+
+
 # ==============================================================================
 # Context Classes
 
@@ -290,10 +297,12 @@ class BoundViewerCommand:
                 check_cooldown = False
                 pay = False
 
-            # Check access level
-            if check_permissions:
+            # Check access level; everyone has at least the lowest level,
+            # so skip computing the viewer's level for unrestricted commands
+            min_access_level = settings.min_access_level
+            if check_permissions and min_access_level > MIN_ACCESS_LEVEL:
                 access_level = viewer.access_level
-                if access_level < settings.min_access_level:
+                if access_level < min_access_level:
                     await ctx.reply((
                         f"Insufficient permissions to use command {alias}"
                     ), mention=True)
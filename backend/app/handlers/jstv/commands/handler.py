@@ -78,6 +78,8 @@ class JSTVCommand(
     __reqcheck__ = False
 
     _subclasses_by_alias: ClassVar[dict[str, list[type["JSTVCommand[Any, Any]"]]]] = {}
+    _handler_by_alias: ClassVar[dict[str, type["JSTVCommand[Any, Any]"]]] = {}
+    """Highest priority handler per alias; kept in sync with `_subclasses_by_alias`."""
 
     def __init_subclass__(cls):
         super().__init_subclass__()
@@ -102,6 +104,8 @@ class JSTVCommand(
                 key=lambda h: -h.priority
             )
 
+            cls._handler_by_alias[alias] = lst[0]
+
         # if effective_aliases:
         #     logger.info(
         #         "Registered command %s with aliases: %s",
@@ -121,8 +125,8 @@ class JSTVCommand(
     def get_handler_by_alias(cls, key: str, default: T = MISSING) -> type["JSTVCommand"] | T:
         key = key.casefold()
         try:
-            return cls._subclasses_by_alias[key][0]
-        except (KeyError, IndexError) as e:
+            return cls._handler_by_alias[key]
+        except KeyError as e:
             if default is MISSING:
                 raise e
             return default
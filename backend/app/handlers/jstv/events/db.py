@@ -47,7 +47,7 @@ async def invoke_events(
             if handler.disabled:
                 continue
 
-            if any(tag in COMMAND_TAGS_DISABLED for tag in handler.tags):
+            if not COMMAND_TAGS_DISABLED.isdisjoint(handler.tags):
                 continue
 
             settings = handler.settings
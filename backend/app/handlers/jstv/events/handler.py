@@ -59,7 +59,7 @@ class JSTVEventHandler(
     __slots__ = ()
     __reqcheck__ = False
 
-    _subclasses_by_type: ClassVar[dict[type[evjstv.JSTVMessage], list[type["JSTVEventHandler[Any, Any, Any]"]]]] = {}
+    _subclasses_by_type: ClassVar[dict[type[evjstv.JSTVMessage], tuple[type["JSTVEventHandler[Any, Any, Any]"], ...]]] = {}
 
     msgtypes: ClassVar[tuple[type[evjstv.JSTVMessage], ...]] = reqcls.required_field()
 
@@ -72,12 +72,15 @@ class JSTVEventHandler(
 
         subclasses = cls._subclasses_by_type
 
+        # Stored as tuples: registration is rare, lookups happen for every event
         for msgtype in cls.msgtypes:
+            lst = list(subclasses.get(msgtype, ()))
             bisect.insort_right(
-                subclasses.setdefault(msgtype, []),
+                lst,
                 cls,
                 key=lambda h: -h.priority
             )
+            subclasses[msgtype] = tuple(lst)
 
         # if cls.msgtypes:
         #     logger.info(
@@ -100,20 +103,39 @@ class JSTVChatTriggerHandler(
 
     triggers: ClassVar[tuple[str | re.Pattern, ...]] = reqcls.required_field()
 
+    _triggers_casefold: ClassVar[tuple[tuple[str | re.Pattern, str], ...]] = ()
+    """Triggers paired with their casefolded text; empty for patterns."""
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+
+        # Skip if not implemented
+        if not reqcls.is_implemented(cls):
+            return
+
+        # Casefolded once here instead of for every chat message
+        cls._triggers_casefold = tuple(
+            (x, "" if isinstance(x, re.Pattern) else x.casefold())
+            for x in cls.triggers
+        )
+
     @classmethod
     @final
     async def handle(cls, ctx) -> bool:
         text = ctx.message.text
-        text_casefold = text.casefold()
+        text_casefold: str | None = None  # Only computed if a text trigger is reached
 
-        for trigger in cls.triggers:
+        for trigger, trigger_casefold in cls._triggers_casefold:
             if isinstance(trigger, re.Pattern):
                 match = trigger.match(text)
                 if match:
                     return await cls.handle_trigger(ctx, match)
 
             else:
-                if trigger.casefold() in text_casefold:
+                if text_casefold is None:
+                    text_casefold = text.casefold()
+
+                if trigger_casefold in text_casefold:
                     return await cls.handle_trigger(ctx, trigger)
 
         return False
@@ -137,11 +159,24 @@ class JSTVChatEmoteHandler(
 
     emote_codes: ClassVar[frozenset[str]] = reqcls.required_field()
 
+    _emote_codes_casefold: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+
+        # Skip if not implemented
+        if not reqcls.is_implemented(cls):
+            return
+
+        # Casefolded once here, so matching an emote is a single set lookup
+        cls._emote_codes_casefold = frozenset(x.casefold() for x in cls.emote_codes)
+
     @classmethod
     @final
     async def handle(cls, ctx) -> bool:
+        codes = cls._emote_codes_casefold
         for emote in ctx.message.emotesUsed:
-            if any(emote.code.casefold() == code.casefold() for code in cls.emote_codes):
+            if emote.code.casefold() in codes:
                 return await cls.handle_emote(ctx, emote)
 
         return False
@@ -25,11 +25,15 @@ plugin_finder = PluginFinder(PLUGIN_NAME, PLUGIN_DIRS)
 def load_jstv_plugins():
     plugin_finder.install()
 
-    for fullname, ispkg in sorted(plugin_finder.iter_plugins()):
-        basename = fullname.rpartition(".")[2]
-        if basename.startswith("_"):
-            continue
+    plugins = [
+        fullname
+        for fullname, ispkg in sorted(plugin_finder.iter_plugins())
+        if not fullname.rpartition(".")[2].startswith("_")
+    ]
+
+    plugin_finder.prefetch_plugins(plugins)
 
+    for fullname in plugins:
         try:
             plugin_finder.import_plugin(fullname)
         except Exception as e:
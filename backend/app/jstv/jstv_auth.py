@@ -1,3 +1,4 @@
+from typing import Iterable
 import logging
 from datetime import timedelta
 
@@ -10,7 +11,7 @@ from app.db.database import AsyncSessionMaker
 from app.db.models import User, Channel, ChannelAccessToken
 
 from . import jstv_web
-from .jstv_error import JSTVTokenNotFound, JSTVTokenRefreshError, JSTVOAuthInitError, JSTVWebError
+from .jstv_error import JSTVAuthError, JSTVTokenNotFound, JSTVTokenRefreshError, JSTVOAuthInitError, JSTVWebError
 
 logger = logging.getLogger(__name__)
 
@@ -44,7 +45,7 @@ async def get_access_token(channel_id: str) -> str:
                 f"No access token for channel {channel_id}, please initialize it first"
             )
 
-        if token.expires_at - utcnow() < timedelta(hours=TOKEN_REFRESH_LEEWAY_HOURS):
+        if _needs_refresh(token):
             try:
                 data = await jstv_web.fetch_refresh_access_token(token.get_refresh_token())
             except JSTVWebError as e:
@@ -56,6 +57,39 @@ async def get_access_token(channel_id: str) -> str:
 
         return token.get_access_token()
 
+async def get_access_tokens(channel_ids: Iterable[str]) -> dict[str, str]:
+    """
+    Get the access tokens of multiple channels, reading them with a single query.
+    Channels without a token, or whose token failed to refresh, are left out.
+    """
+    access_tokens: dict[str, str] = {}
+    expiring: list[str] = []
+
+    async with AsyncSessionMaker.begin() as db:
+        result = await db.execute(
+            select(Channel.channel_id, ChannelAccessToken)
+            .join(Channel)
+            .filter(Channel.channel_id.in_(list(channel_ids)))
+        )
+
+        for channel_id, token in result.tuples():
+            if _needs_refresh(token):
+                expiring.append(channel_id)
+            else:
+                access_tokens[channel_id] = token.get_access_token()
+
+    # NOTE: Each refresh commits in its own transaction (see top of module)
+    for channel_id in expiring:
+        try:
+            access_tokens[channel_id] = await get_access_token(channel_id)
+        except JSTVAuthError:
+            continue
+
+    return access_tokens
+
+def _needs_refresh(token: ChannelAccessToken) -> bool:
+    return token.expires_at - utcnow() < timedelta(hours=TOKEN_REFRESH_LEEWAY_HOURS)
+
 async def init_access_token(auth_code: str) -> str:
     async with AsyncSessionMaker.begin() as db:
         # Get access token
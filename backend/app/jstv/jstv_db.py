@@ -2,12 +2,16 @@ from dataclasses import dataclass, field, InitVar
 from datetime import datetime, timedelta
 
 from sqlalchemy import select
+from sqlalchemy.orm import contains_eager
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.datetime import utcnow
 
 from app.db.models import ConnectionState, User, Channel, Viewer
 
+# Channel primary key by channel_id; lets lookups hit the session identity map
+_channel_pks: dict[str, int] = {}
+
 
 # ==============================================================================
 # Context classes
@@ -98,8 +102,23 @@ async def get_channel(
     db: AsyncSession,
     channel_id: str,
 ) -> Channel | None:
+    pk = _channel_pks.get(channel_id)
+    if pk is not None:
+        channel = await db.get(Channel, pk)
+
+        # NOTE: The row may have been rolled back and its key reused since
+        if channel is not None and channel.channel_id == channel_id:
+            return channel
+
+        _channel_pks.pop(channel_id, None)
+
     result = await db.execute(select(Channel).filter_by(channel_id=channel_id))
-    return result.scalar_one_or_none()
+    channel = result.scalar_one_or_none()
+
+    if channel is not None:
+        _channel_pks[channel_id] = channel.id
+
+    return channel
 
 async def get_or_create_channel(
     db: AsyncSession,
@@ -150,6 +169,21 @@ async def get_viewer(
     result = await db.execute(select(Viewer).filter_by(user_id=user.id, channel_id=channel.id))
     return result.scalar_one_or_none()
 
+async def get_viewer_by_names(
+    db: AsyncSession,
+    channel_id: str,
+    username: str,
+) -> Viewer | None:
+    """Get a viewer, with its channel and user loaded, in a single query."""
+    result = await db.execute(
+        select(Viewer)
+        .join(Viewer.channel)
+        .join(Viewer.user)
+        .options(contains_eager(Viewer.channel), contains_eager(Viewer.user))
+        .filter(Channel.channel_id == channel_id, User.username == username)
+    )
+    return result.scalar_one_or_none()
+
 async def get_or_create_viewer(
     db: AsyncSession,
     channel: Channel | str,
@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Iterable
 
 from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.utils.datetime import utcmin, utcnow
@@ -11,7 +12,7 @@ from app.utils.datetime import utcmin, utcnow
 from app.db.models import Channel, User, Viewer, MAX_SESSION_RECOVERY_TIME
 
 from app.jstv import jstv_db, jstv_web, jstv_auth
-from app.jstv.jstv_error import JSTVAuthError, JSTVWebError
+from app.jstv.jstv_error import JSTVWebError
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,12 @@ REWARD_STREAK_FIXED: int = 100
 """fixed points for each consecutive stream"""
 
 
+# ==============================================================================
+# Constants
+
+REWARD_INTERVAL_DELTA = timedelta(seconds=REWARD_INTERVAL)
+
+
 # ==============================================================================
 # Interface
 
@@ -97,6 +104,8 @@ def adjust_viewer_points(
 def reward_viewer_watch_time(
     channel: Channel,
     viewer: Viewer,
+    *,
+    now: datetime | None = None,
 ) -> int:
     """
     Reward a viewer with points and watch time.
@@ -109,13 +118,15 @@ def reward_viewer_watch_time(
     Args:
         channel: The Channel instance.
         viewer: The Viewer instance to reward.
+        now: Current time; defaults to `utcnow()`.
 
     Returns:
         The number of points rewarded.
     """
     # Determine reward window
     # NOTE: Channel and viewer live/presence related timestamps are never None.
-    now = utcnow()
+    if now is None:
+        now = utcnow()
     time_start = max(
         channel.live_started_at,
         viewer.presence_started_at,
@@ -131,9 +142,10 @@ def reward_viewer_watch_time(
         return 0
 
     # Round down to the nearest REWARD_INTERVAL
-    intervals: int = int((time_end - time_start).total_seconds() / REWARD_INTERVAL)
-    seconds: int = int(intervals * REWARD_INTERVAL)
-    time_end = time_start + timedelta(seconds=seconds)
+    # NOTE: timedelta floor division is exact integer math, no float round-trip
+    intervals: int = (time_end - time_start) // REWARD_INTERVAL_DELTA
+    seconds: int = intervals * REWARD_INTERVAL
+    time_end = time_start + intervals * REWARD_INTERVAL_DELTA
 
     # Return if no reward is due
     if seconds <= 0:
@@ -172,6 +184,39 @@ def reward_viewer_watch_time(
 
     return points
 
+def reward_viewers_watch_time(
+    viewers: Iterable[Viewer],
+    channel: Channel | None = None,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """
+    Reward multiple viewers with points and watch time.
+
+    All viewers share a single reward cutoff time. The resulting row updates
+    are written in one batch when the session flushes.
+
+    WARNING: Make sure that viewer and channel presence/online status are up-to-date before calling.
+
+    Args:
+        viewers: The Viewer instances to reward.
+        channel: The Channel shared by all viewers; defaults to each `viewer.channel`.
+        now: Current time; defaults to `utcnow()`.
+
+    Returns:
+        The total number of points rewarded.
+    """
+    if now is None:
+        now = utcnow()
+
+    total = 0
+    for viewer in viewers:
+        total += reward_viewer_watch_time(
+            viewer.channel if channel is None else channel, viewer, now=now,
+        )
+
+    return total
+
 def update_watch_streak(channel: Channel, viewer: Viewer) -> None:
     """
     Update viewer watch streak.
@@ -213,14 +258,20 @@ async def on_connected(db: AsyncSession) -> set[Channel]:
 
     cutoff_at = min(now, last_event_at + timedelta(seconds=MAX_SESSION_RECOVERY_TIME))
 
+    # Load all access tokens at once
+    access_tokens = await jstv_auth.get_access_tokens(x.channel_id for x in channels)
+
     # Fetch stream settings for all channels in parallel
     async def get_live_status_helper(
         channel: Channel,
     ) -> tuple[Channel, jstv_web.StreamSettings | None]:
+        access_token = access_tokens.get(channel.channel_id)
+        if access_token is None:
+            return channel, None
+
         try:
-            access_token = await jstv_auth.get_access_token(channel.channel_id)
             settings = await jstv_web.fetch_stream_settings(access_token)
-        except (JSTVAuthError, JSTVWebError):
+        except JSTVWebError:
             return channel, None
 
         return channel, settings
@@ -270,7 +321,8 @@ async def on_connected(db: AsyncSession) -> set[Channel]:
         # Mark all present viewers as offline and reward them up until `cutoff_at`
         for viewer in viewers:
             viewer.force_offline(cutoff_at)
-            reward_viewer_watch_time(channel, viewer)  # WARNING: Channel and viewer must be up-to-date
+
+        reward_viewers_watch_time(viewers, channel, now=now)  # WARNING: Channel and viewers must be up-to-date
 
     return channels
 
@@ -286,7 +338,7 @@ async def on_disconnected(db: AsyncSession) -> None:
     result = await db.execute(
         select(Viewer)
         .join(Viewer.channel)
-        .options(joinedload(Viewer.channel))
+        .options(contains_eager(Viewer.channel))
         .filter(Viewer.is_present.is_(True), Channel.is_live.is_(True)),
     )
 
@@ -299,23 +351,25 @@ async def on_disconnected(db: AsyncSession) -> None:
         len(viewers),
     )
 
-    for viewer in viewers:
-        # NOTE: We rely on recovery to mark viewers as offline later, if needed
-        reward_viewer_watch_time(viewer.channel, viewer)  # WARNING: Channel and viewer must be up-to-date
+    # NOTE: We rely on recovery to mark viewers as offline later, if needed
+    reward_viewers_watch_time(viewers)  # WARNING: Channels and viewers must be up-to-date
 
-async def on_server_message(db: AsyncSession) -> None:
-    await jstv_db.update_last_event_received_time(db)
+async def on_server_message(db: AsyncSession, time: datetime | None = None) -> None:
+    await jstv_db.update_last_event_received_time(db, time)
 
 async def on_viewer_interaction(
     db: AsyncSession,
     channel: Channel | str,
     user: User | str,
     viewer: Viewer | None,
+    *,
+    now: datetime | None = None,
 ) -> None:
     if not isinstance(viewer, Viewer):
         viewer = await jstv_db.get_or_create_viewer(db, channel, user)
 
-    now = utcnow()
+    if now is None:
+        now = utcnow()
 
     if viewer.first_seen_at is None:
         viewer.first_seen_at = now
@@ -376,10 +430,9 @@ async def on_stream_ended(db: AsyncSession, channel: Channel | str):
         channel.channel_id, len(viewers),
     )
 
-    for viewer in viewers:
-        # NOTE: We do NOT mark viewers offline here.
-        #       Offline inference is handled by leave events or recovery.
-        reward_viewer_watch_time(channel, viewer)  # WARNING: Channel and viewer must be up-to-date
+    # NOTE: We do NOT mark viewers offline here.
+    #       Offline inference is handled by leave events or recovery.
+    reward_viewers_watch_time(viewers, channel)  # WARNING: Channel and viewers must be up-to-date
 
 async def on_enter_stream(
     db: AsyncSession,
@@ -396,6 +449,12 @@ async def on_enter_stream(
     Notes:
     - This event may arrive while the channel is offline.
     """
+    # Load a known viewer along with its channel in a single query
+    if viewer is None and isinstance(channel, str) and isinstance(user, str):
+        viewer = await jstv_db.get_viewer_by_names(db, channel, user)
+        if viewer is not None:
+            channel = viewer.channel
+
     if not isinstance(channel, Channel):
         channel = await jstv_db.get_or_create_channel(db, channel)
 
@@ -421,6 +480,12 @@ async def on_leave_stream(
     - Viewers who joined while the channel was offline are NOT rewarded here.
       Their potential reward (if any) is handled by `on_stream_ended` or recovery.
     """
+    # Load a known viewer along with its channel in a single query
+    if viewer is None and isinstance(channel, str) and isinstance(user, str):
+        viewer = await jstv_db.get_viewer_by_names(db, channel, user)
+        if viewer is not None:
+            channel = viewer.channel
+
     if not isinstance(channel, Channel):
         channel = await jstv_db.get_or_create_channel(db, channel)
 
@@ -446,6 +511,8 @@ async def on_new_chat(
     channel: Channel | str,
     user: User | str,
     viewer: Viewer | None,
+    *,
+    now: datetime | None = None,
 ) -> int:
     if not isinstance(channel, Channel):
         channel = await jstv_db.get_or_create_channel(db, channel)
@@ -464,7 +531,7 @@ async def on_new_chat(
     )
 
     viewer.total_chatted += 1
-    viewer.last_chatted_at = utcnow()
+    viewer.last_chatted_at = now if now is not None else utcnow()
 
     points = adjust_viewer_points(viewer, points, reason, limit=True)
 
@@ -17,10 +17,17 @@ class PluginLoader(SourceLoader):
     """
     fullname: str
     source: PluginSource
-
-    def __init__(self, fullname: str, source: PluginSource) -> None:
+    source_cache: dict[PluginSource, bytes]
+
+    def __init__(
+        self,
+        fullname: str,
+        source: PluginSource,
+        source_cache: dict[PluginSource, bytes] | None = None,
+    ) -> None:
         self.fullname = fullname
         self.source = source
+        self.source_cache = {} if source_cache is None else source_cache
 
     def get_filename(self, fullname: str) -> str:
         if fullname != self.fullname:
@@ -29,9 +36,15 @@ class PluginLoader(SourceLoader):
 
     def get_data(self, path: str) -> bytes:
         try:
-            if not self.source.samefile(path):
+            # Fast path: the import system passes back get_filename()
+            if path != str(self.source) and not self.source.samefile(path):
                 raise OSError(f"File not found: {path}")
 
+            # Use (and consume) source prefetched by the finder, if any
+            data = self.source_cache.pop(self.source, None)
+            if data is not None:
+                return data
+
             with self.source.open("rb") as fh:
                 data = fh.read()
                 assert isinstance(data, bytes)
@@ -3,6 +3,8 @@ from types import ModuleType
 import importlib
 from importlib.abc import MetaPathFinder
 from importlib.machinery import ModuleSpec, SOURCE_SUFFIXES
+from concurrent.futures import ThreadPoolExecutor
+import os
 import sys
 
 from ._types import PluginSource, AnyPluginSource, PluginParts, PluginPathInfo, PluginParts
@@ -17,6 +19,16 @@ __all__ = [
 VIRTUAL_BASE_PACKAGE = __package__ or "<plugins>"
 
 
+# ==============================================================================
+# Helpers
+
+def _read_source(file: PluginSource) -> bytes | None:
+    try:
+        return file.read_bytes()
+    except OSError:
+        return None
+
+
 # ==============================================================================
 # PluginFinder
 
@@ -30,6 +42,7 @@ class PluginFinder(MetaPathFinder):
 
     _plugin_file_cache: dict[PluginParts, PluginPathInfo | None]
     _plugin_folder_cache: dict[PluginParts, tuple[PluginPathInfo, ...]]
+    _source_cache: dict[PluginSource, bytes]
 
     def __init__(
         self,
@@ -45,6 +58,7 @@ class PluginFinder(MetaPathFinder):
 
         self._plugin_file_cache = {}
         self._plugin_folder_cache = {}
+        self._source_cache = {}
 
     @property
     def package(self) -> str:
@@ -85,14 +99,16 @@ class PluginFinder(MetaPathFinder):
 
         sys.meta_path.append(self)
 
-        # Clear any loaders that might already be in use by the FileFinder
-        sys.path_importer_cache.clear()
+        # NOTE: sys.path_importer_cache is left alone: the virtual plugin
+        #       packages can never be served by path entry finders, and
+        #       clearing it would force every sys.path entry to be rescanned.
         self.invalidate_caches()
 
     def invalidate_caches(self) -> None:
         """Clear all internal caches."""
         self._plugin_file_cache.clear()
         self._plugin_folder_cache.clear()
+        self._source_cache.clear()
 
     def _find_plugin_info(self, parts: PluginParts) -> PluginPathInfo | None:
         """
@@ -146,22 +162,27 @@ class PluginFinder(MetaPathFinder):
         yielded: set[str] = set()
         for source in self.sources:
             full_path = source / plugin_path
-            if not full_path.is_dir():
+
+            # scandir() entries cache their file type, avoiding a stat per check
+            try:
+                with os.scandir(full_path) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
                 continue
 
-            for file in full_path.iterdir():
+            for entry in entries:
+                file = PluginSource(entry.path)
                 stem = file.stem
                 if stem in yielded:
                     continue
 
-                if not file.exists():
-                    continue
-
-                ispkg = file.is_dir()
+                ispkg = entry.is_dir()
                 if ispkg:
                     if file.suffix:
                         continue
                 else:
+                    if not entry.is_file():
+                        continue
                     if file.suffix not in self.exts:
                         continue
 
@@ -184,6 +205,29 @@ class PluginFinder(MetaPathFinder):
         for info in self._iter_sub_plugin_info(parts):
             yield info.plugin_path, info.ispkg
 
+    def prefetch_plugins(self, plugin_paths: Iterable[str]) -> None:
+        """
+        Read the sources of the given plugins concurrently, ahead of importing them.
+        Imports themselves should stay sequential to keep registration order stable.
+        """
+        files: list[PluginSource] = []
+        for plugin_path in plugin_paths:
+            try:
+                info = self._find_plugin_info(PluginParts.from_plugin_path(plugin_path))
+            except ValueError:
+                continue
+
+            if info is not None and not info.ispkg:
+                files.append(info.source)
+
+        if not files:
+            return
+
+        with ThreadPoolExecutor() as pool:
+            for file, data in zip(files, pool.map(_read_source, files)):
+                if data is not None:
+                    self._source_cache[file] = data
+
     def import_plugin(self, plugin_path: str) -> ModuleType:
         """
         Import a plugin.
@@ -228,7 +272,7 @@ class PluginFinder(MetaPathFinder):
         if info.ispkg:
             return ModuleSpec(fullname, None, is_package=True)
 
-        loader = PluginLoader(fullname, info.source)
+        loader = PluginLoader(fullname, info.source, self._source_cache)
 
         spec = ModuleSpec(fullname, loader, origin=str(info.source))
         spec.has_location = True
@@ -4,7 +4,6 @@ import asyncio
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from app.utils.asyncio import async_select
 from app.connectors.buttplug import VibeGroup, VibeFrame, VibeTarget
 
 # NOTE: Frontend expects all times to be in milliseconds
@@ -69,6 +68,10 @@ class VibeConfig(BaseModel):
 config = VibeConfig()
 clear_queue = False
 
+# Set whenever config, clear_queue or the vibe delay changes, so the vibe loop
+# can react right away instead of polling
+state_changed = asyncio.Event()
+
 
 # ==============================================================================
 # Helper functions
@@ -174,14 +177,14 @@ async def ws_vibegraph(ws: WebSocket) -> None:
 
     handle_close = True
 
+    # NOTE: One receive task for the whole connection; pings go out whenever it idles
+    treceive = asyncio.create_task(ws.receive())
+
     clients.add(ws)
     try:
         while True:
-            tsleep = asyncio.create_task(asyncio.sleep(PING_INTERVAL))
-            treceive = asyncio.create_task(ws.receive())
-
-            done = await async_select(tsleep, treceive)
-            if treceive in done:
+            done, _ = await asyncio.wait((treceive,), timeout=PING_INTERVAL)
+            if done:
                 handle_close = False
                 break
 
@@ -194,6 +197,7 @@ async def ws_vibegraph(ws: WebSocket) -> None:
         handle_close = False
 
     finally:
+        treceive.cancel()
         clients.discard(ws)
         if handle_close:
             asyncio.create_task(ws.close())
@@ -316,6 +320,7 @@ def get_config():
 async def save_config(payload: VibeConfig):
     global config
     config = payload
+    state_changed.set()
     await bcast_update_config()
     return {"status": "ok"}
 
@@ -324,4 +329,5 @@ async def save_config(payload: VibeConfig):
 async def save_clear_queue():
     global clear_queue
     clear_queue = True
+    state_changed.set()
     return {"status": "ok"}
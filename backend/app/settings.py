@@ -37,6 +37,7 @@ POINTS_NAME = os.getenv("POINTS_NAME") or "Points"
 SERVER_HOST = os.getenv("SERVER_HOST", "http://localhost")
 SERVER_PORT = int(os.getenv("SERVER_PORT", "29392"))
 SERVER_STATIC_PATH = os.getenv("SERVER_STATIC_PATH", "/static")
+EVENT_LOOP = os.getenv("EVENT_LOOP", "auto").lower()  # auto, uvloop or asyncio
 
 # CORS
 CORS_ALLOW_ORIGINS = getenv_list("CORS_ALLOW_ORIGINS", "http://localhost:5173, http://127.0.0.1:5173, http://localhost:29392, http://127.0.0.1:29392")
@@ -62,5 +63,6 @@ DATABASE_DIR = Path(os.getenv("DATABASE_DIR", "database")).resolve()
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite+aiosqlite:///{DATABASE_DIR / 'app.db'}")
 
 # Connector settings
+ENABLED_CONNECTORS = getenv_list("ENABLED_CONNECTORS", "JoystickTV, Warudo, OBS, Buttplug, PiShock, VRChat")
 MAX_INIT_ATTEMPTS = int(os.getenv("MAX_INIT_ATTEMPTS", 6))
 MAX_RECONNECT_DELAY = int(os.getenv("MAX_RECONNECT_DELAY", 60))
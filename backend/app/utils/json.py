@@ -0,0 +1,46 @@
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = [
+    "JSONDecodeError",
+    "loads",
+    "dumps",
+    "dumps_str",
+]
+
+
+# ==============================================================================
+# JSON Utils
+#
+# Backed by orjson when it is installed, falling back to the stdlib otherwise.
+# Both produce compact UTF-8 output, so callers see the same result either way.
+
+# NOTE: orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    def loads(data: str | bytes) -> Any:
+        """Deserialize JSON from str or UTF-8 bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to JSON as UTF-8 bytes."""
+        return orjson.dumps(obj)
+
+else:
+    def loads(data: str | bytes) -> Any:
+        """Deserialize JSON from str or UTF-8 bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to JSON as UTF-8 bytes."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+def dumps_str(obj: Any) -> str:
+    """Serialize to JSON as str."""
+    return dumps(obj).decode()
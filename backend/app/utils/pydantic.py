@@ -1,9 +1,10 @@
 from typing import TypeVar, Annotated, ClassVar
 import logging
-import json
 
 from pydantic import BaseModel, ConfigDict, BeforeValidator
 
+from app.utils import json
+
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,51 @@
+import os
+import asyncio
+import unittest
+from contextlib import asynccontextmanager
+
+os.environ.setdefault("FERNET_KEY", "test")
+
+from app.connector import ConnectorManager, WebSocketConnector
+
+
+class StalledWebSocket:
+    """A connection whose sends never complete."""
+
+    async def send(self, data, text=None):
+        await asyncio.Event().wait()
+
+
+class StalledConnector(WebSocketConnector):
+    NAME = "TestStalled"
+
+    def _get_url(self) -> str:
+        return "ws://localhost"
+
+    @asynccontextmanager
+    async def _create_connection(self, **kwargs):
+        yield StalledWebSocket()
+
+
+class SendNowTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pending_send_fails_when_connection_closes(self):
+        conn = StalledConnector(ConnectorManager())
+
+        async with conn.connect():
+            conn._connected = True
+            pending = asyncio.create_task(conn.sendnow("hello"))
+            await asyncio.sleep(0)
+            self.assertFalse(pending.done())
+
+        self.assertFalse(await asyncio.wait_for(pending, 1))
+
+    async def test_send_after_close_fails(self):
+        conn = StalledConnector(ConnectorManager())
+
+        async with conn.connect():
+            conn._connected = True
+
+        self.assertFalse(await asyncio.wait_for(conn.sendnow("hello"), 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
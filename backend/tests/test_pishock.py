@@ -0,0 +1,38 @@
+import os
+import unittest
+
+os.environ.setdefault("FERNET_KEY", "test")
+os.environ.setdefault("PISHOCK_USERNAME", "test")
+os.environ.setdefault("PISHOCK_APIKEY", "test")
+os.environ.setdefault("PISHOCK_SHARECODE", "test")
+
+from app.connectors.pishock import _parse_float_range, parse_shocks
+
+
+class ParseFloatRangeTest(unittest.TestCase):
+    def test_accepts_decimals(self):
+        self.assertEqual(_parse_float_range("1.5s", suffix="s"), 1.5)
+        self.assertEqual(_parse_float_range("2s", suffix="s"), 2.0)
+        self.assertTrue(1.0 <= _parse_float_range("1s-2.5s", suffix="s") <= 2.5)
+        self.assertTrue(1.0 <= _parse_float_range("1-2s", suffix="s") <= 2.0)
+
+    def test_rejects_non_decimals(self):
+        for source in (
+            "infs", "nans", "inf-5s", "nan-2s", "5-infs", "2-nans",
+            "1e3s", "1-1e3s", "-1s", "1.s", ".5s", "1.2.3s", "1--2s", "s", "",
+        ):
+            with self.subTest(source=source):
+                with self.assertRaises(ValueError):
+                    _parse_float_range(source, suffix="s")
+
+
+class ParseShocksTest(unittest.TestCase):
+    def test_rejects_non_decimal_duration(self):
+        for vibestr in ("shock 50% 5-infs", "shock 50% 1-nans", "shock 50% 1e3s"):
+            with self.subTest(vibestr=vibestr):
+                with self.assertRaises(ValueError):
+                    parse_shocks(vibestr)
+
+
+if __name__ == "__main__":
+    unittest.main()